@@ -3,17 +3,37 @@ access-config-utils package.
 """
 
 from contextlib import suppress
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
 
 __version__ = "unknown"
 with suppress(PackageNotFoundError):
     __version__ = version("access-config-utils")
 
-from access.config.fortran_nml import FortranNMLParser
-from access.config.mom6_input import MOM6InputParser
-from access.config.nuopc_config import NUOPCParser
-from access.config.parser import ConfigParser
-from access.config.yaml_config import YAMLParser
+if TYPE_CHECKING:
+    # Let static type checkers resolve the lazily imported parsers to their actual classes
+    from access.config.fortran_nml import FortranNMLParser
+    from access.config.mom6_input import MOM6InputParser
+    from access.config.nuopc_config import NUOPCParser
+    from access.config.parser import ConfigParser
+    from access.config.yaml_config import YAMLParser
+
+# The parsers are imported on first access (PEP 562), so that importing the package, or one of its submodules that
+# does not need them (e.g. the layout utilities), does not pay for importing Lark and ruamel.yaml.
+_LAZY_IMPORTS = {
+    "ConfigParser": "access.config.parser",
+    "FortranNMLParser": "access.config.fortran_nml",
+    "MOM6InputParser": "access.config.mom6_input",
+    "YAMLParser": "access.config.yaml_config",
+    "NUOPCParser": "access.config.nuopc_config",
+}
+
+# Submodules that used to be imported as a side effect of importing the parsers eagerly. They are still reachable as
+# attributes of the package (e.g. ``access.config.fortran_nml``) after a plain ``import access.config``.
+_LAZY_SUBMODULES = frozenset(
+    {"fortran_nml", "mom6_input", "nuopc_config", "parse_tree_ops", "parser", "parser_types", "yaml_config"}
+)
 
 __all__ = [
     "ConfigParser",
@@ -22,3 +42,20 @@ __all__ = [
     "YAMLParser",
     "NUOPCParser",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        # Importing a submodule also binds it as an attribute of the package
+        return import_module(f"{__name__}.{name}")
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    # Cache the class in the module namespace, so that this function is only called on first access
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | _LAZY_SUBMODULES)
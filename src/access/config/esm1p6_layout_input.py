@@ -221,8 +221,9 @@ class LayoutSearchConfig:
             else (1.0 + self.tol_around_ctrl_ratio) * self.ctrl_ratio
         )
         logger.debug(
-            f"Setting frac_mom_ncores_over_atm_ncores from tolerance around control ratio: "
-            f"min={min_frac}, max={max_frac}"
+            "Setting frac_mom_ncores_over_atm_ncores from tolerance around control ratio: min=%s, max=%s",
+            min_frac,
+            max_frac,
         )
         self.frac_mom_ncores_over_atm_ncores = (min_frac, max_frac)
 
@@ -263,9 +264,11 @@ def set_ice_ncores(min_ice_ncores: int, max_ice_ncores: int, blocksize: int = 36
             f"No valid cores found for ice ncores in the range ({min_ice_ncores}, {max_ice_ncores}). "
             "Please increase the min. and max. range of ICE ncores to use"
         )
-    logger.debug(f"Factors of blocksize {blocksize} in the range ({min_ice_ncores}, {max_ice_ncores}): {factors}")
+    logger.debug(
+        "Factors of blocksize %s in the range (%s, %s): %s", blocksize, min_ice_ncores, max_ice_ncores, factors
+    )
     ice_ncores = min(factors) if smallest_factor else max(factors)
-    logger.debug(f"Selected ice ncores = {ice_ncores}")
+    logger.debug("Selected ice ncores = %s", ice_ncores)
     return ice_ncores
 
 
@@ -292,7 +295,8 @@ def _generate_esm1p6_layout_from_core_counts(  # noqa: C901
 
     max_atm_ncores : int, required
         Maximum number of ATM cores to consider when generating layouts.
-        Must be at least 2 and greater than or equal to min_atm_ncores.
+        Must be at least 2, greater than or equal to min_atm_ncores, and less than
+        ncores_for_atm_and_ocn (so that at least 1 core is left for mom).
 
     ncores_for_atm_and_ocn : int, required
         Total number of cores available for ATM and MOM.
@@ -327,6 +331,12 @@ def _generate_esm1p6_layout_from_core_counts(  # noqa: C901
             f"(2 for atm and 1 for mom). Got {ncores_for_atm_and_ocn} instead"
         )
 
+    if max_atm_ncores >= ncores_for_atm_and_ocn:
+        raise ValueError(
+            f"Max. ATM ncores ({max_atm_ncores}) must be less than the number of cores available for ATM and OCN "
+            f"({ncores_for_atm_and_ocn}), so that at least 1 core is left for mom"
+        )
+
     if min_ncores_needed > (ncores_for_atm_and_ocn + ice_ncores):
         raise ValueError(
             f"Min. number of cores needed ({min_ncores_needed}) cannot be greater than the total "
@@ -334,10 +344,12 @@ def _generate_esm1p6_layout_from_core_counts(  # noqa: C901
         )
     if min_ncores_needed < ncores_for_atm_and_ocn:
         logger.warning(
-            f"Min. total cores required for a valid config ({min_ncores_needed}) should be greater "
-            f"than the number of ATM + OCN cores ({ncores_for_atm_and_ocn}). "
-            f"Currently, any config that satisfies the ATM + OCN core requirements will also satisfy "
-            "the requirement for the min. total cores"
+            "Min. total cores required for a valid config (%s) should be greater "
+            "than the number of ATM + OCN cores (%s). "
+            "Currently, any config that satisfies the ATM + OCN core requirements will also satisfy "
+            "the requirement for the min. total cores",
+            min_ncores_needed,
+            ncores_for_atm_and_ocn,
         )
 
     if layout_search_config is not None:
@@ -347,16 +359,28 @@ def _generate_esm1p6_layout_from_core_counts(  # noqa: C901
 
     all_layouts = []
     logger.debug(
-        f"Generating layouts with {min_atm_ncores=}, {max_atm_ncores=}, {layout_search_config.atm_ncore_stepsize=}, "
-        f"{ncores_for_atm_and_ocn=}, {ice_ncores=}, {min_ncores_needed=}, "
-        f"{layout_search_config.frac_mom_ncores_over_atm_ncores=}, "
-        f"{layout_search_config.abs_maxdiff_nx_ny=}, "
-        f"{layout_search_config.prefer_atm_nx_greater_than_ny=}, "
-        f"{layout_search_config.prefer_mom_nx_greater_than_ny=}, "
-        f"{layout_search_config.prefer_atm_ncores_greater_than_mom_ncores=}"
+        "Generating layouts with min_atm_ncores=%s, max_atm_ncores=%s, layout_search_config.atm_ncore_stepsize=%s, "
+        "ncores_for_atm_and_ocn=%s, ice_ncores=%s, min_ncores_needed=%s, "
+        "layout_search_config.frac_mom_ncores_over_atm_ncores=%s, "
+        "layout_search_config.abs_maxdiff_nx_ny=%s, "
+        "layout_search_config.prefer_atm_nx_greater_than_ny=%s, "
+        "layout_search_config.prefer_mom_nx_greater_than_ny=%s, "
+        "layout_search_config.prefer_atm_ncores_greater_than_mom_ncores=%s",
+        min_atm_ncores,
+        max_atm_ncores,
+        layout_search_config.atm_ncore_stepsize,
+        ncores_for_atm_and_ocn,
+        ice_ncores,
+        min_ncores_needed,
+        layout_search_config.frac_mom_ncores_over_atm_ncores,
+        layout_search_config.abs_maxdiff_nx_ny,
+        layout_search_config.prefer_atm_nx_greater_than_ny,
+        layout_search_config.prefer_mom_nx_greater_than_ny,
+        layout_search_config.prefer_atm_ncores_greater_than_mom_ncores,
     )
+    prefer_atm_ncores_greater_than_mom_ncores = layout_search_config.prefer_atm_ncores_greater_than_mom_ncores
     for atm_ncores in range(min_atm_ncores, max_atm_ncores + 1, layout_search_config.atm_ncore_stepsize):
-        logger.debug(f"Trying atm_ncores = {atm_ncores}")
+        logger.debug("Trying atm_ncores = %s", atm_ncores)
         atm_layout = find_layouts_with_maxncore(
             atm_ncores,
             abs_maxdiff_nx_ny=layout_search_config.abs_maxdiff_nx_ny,
@@ -366,15 +390,22 @@ def _generate_esm1p6_layout_from_core_counts(  # noqa: C901
         if not atm_layout:
             continue
 
-        logger.debug(f"  Found {len(atm_layout)} atm layouts for atm_ncores = {atm_ncores}: {atm_layout}")
+        logger.debug("  Found %d atm layouts for atm_ncores = %s: %s", len(atm_layout), atm_ncores, atm_layout)
 
         min_mom_ncores = int(atm_ncores * layout_search_config.frac_mom_ncores_over_atm_ncores[0])
         max_mom_ncores = int(atm_ncores * layout_search_config.frac_mom_ncores_over_atm_ncores[1])
-        for atm in atm_layout:
-            atm_nx, atm_ny = atm
-
-            mom_ncores = ncores_for_atm_and_ocn - atm_nx * atm_ny
-            logger.debug(f"  Trying atm layout {atm_nx}x{atm_ny} with {atm_nx * atm_ny} ncores")
+        for atm_nx, atm_ny in atm_layout:
+            atm_layout_ncores = atm_nx * atm_ny
+            mom_ncores = ncores_for_atm_and_ocn - atm_layout_ncores
+            logger.debug("  Trying atm layout %sx%s with %s ncores", atm_nx, atm_ny, atm_layout_ncores)
+            if mom_ncores < min_mom_ncores:
+                # All the mom layouts would use at most mom_ncores, so they would all be outside the allowed range
+                logger.debug(
+                    "  Skipping atm layout, as the %s remaining ncores are less than the min. mom ncores = %s",
+                    mom_ncores,
+                    min_mom_ncores,
+                )
+                continue
             mom_layout = find_layouts_with_maxncore(
                 mom_ncores,
                 abs_maxdiff_nx_ny=layout_search_config.abs_maxdiff_nx_ny,
@@ -389,28 +420,47 @@ def _generate_esm1p6_layout_from_core_counts(  # noqa: C901
                 mom_ncores = mom_nx * mom_ny
                 if mom_ncores < min_mom_ncores or mom_ncores > max_mom_ncores:
                     logger.debug(
-                        f"Skipping mom layout {mom_nx}x{mom_ny} with {mom_ncores} ncores "
-                        f"not in the range [{min_mom_ncores}, {max_mom_ncores}]"
+                        "Skipping mom layout %sx%s with %s ncores not in the range [%s, %s]",
+                        mom_nx,
+                        mom_ny,
+                        mom_ncores,
+                        min_mom_ncores,
+                        max_mom_ncores,
                     )
                     continue
 
-                if layout_search_config.prefer_atm_ncores_greater_than_mom_ncores and (atm_nx * atm_ny < mom_ncores):
+                if prefer_atm_ncores_greater_than_mom_ncores and (atm_layout_ncores < mom_ncores):
                     logger.debug(
-                        f"Skipping mom layout since mom ncores = {mom_nx}x{mom_ny} is not less "
-                        f"than atm ncores = {atm_nx * atm_ny}"
+                        "Skipping mom layout since mom ncores = %sx%s is not less than atm ncores = %s",
+                        mom_nx,
+                        mom_ny,
+                        atm_layout_ncores,
                     )
                     continue
 
-                ncores_used = mom_nx * mom_ny + atm_nx * atm_ny + ice_ncores
+                ncores_used = mom_ncores + atm_layout_ncores + ice_ncores
                 if ncores_used < min_ncores_needed:
                     logger.debug(
-                        f"Skipping layout atm {atm_nx}x{atm_ny} mom {mom_nx}x{mom_ny} ice {ice_ncores}, "
-                        f"with {ncores_used=} is less than {min_ncores_needed=}"
+                        "Skipping layout atm %sx%s mom %sx%s ice %s, "
+                        "with ncores_used=%s is less than min_ncores_needed=%s",
+                        atm_nx,
+                        atm_ny,
+                        mom_nx,
+                        mom_ny,
+                        ice_ncores,
+                        ncores_used,
+                        min_ncores_needed,
                     )
                     continue
 
                 logger.debug(
-                    f"Adding layout atm {atm_nx}x{atm_ny} mom {mom_nx}x{mom_ny} ice {ice_ncores} with {ncores_used=}"
+                    "Adding layout atm %sx%s mom %sx%s ice %s with ncores_used=%s",
+                    atm_nx,
+                    atm_ny,
+                    mom_nx,
+                    mom_ny,
+                    ice_ncores,
+                    ncores_used,
                 )
                 layout.append(LayoutTuple(atm_nx, atm_ny, mom_nx, mom_ny, ice_ncores))
 
@@ -509,12 +559,13 @@ def generate_esm1p6_core_layouts_from_node_count(
     totncores = int(num_nodes * cores_per_node)
     if totncores < min_cores_required:
         logger.warning(
-            f"Total ncores = {totncores} is less than the min. ncores required = {min_cores_required}."
-            "Returning an empty list"
+            "Total ncores = %s is less than the min. ncores required = %s. Returning an empty list",
+            totncores,
+            min_cores_required,
         )
         return []
 
-    logger.debug(f"Generating layouts for {num_nodes = } nodes")
+    logger.debug("Generating layouts for num_nodes = %s nodes", num_nodes)
     target_ice_ncores = max(1, int(ctrl_ice_ncores / ctrl_totncores * totncores))
     # Allow a 20% increase in ice ncores over the target to find a suitable factor of blocksize (360 for ESM1.6)
     ice_ncores = set_ice_ncores(min_ice_ncores=target_ice_ncores, max_ice_ncores=int(target_ice_ncores * 1.2))
@@ -530,9 +581,12 @@ def generate_esm1p6_core_layouts_from_node_count(
     min_atm_ncores = max(2, int(ncores_left / (1.0 + max_frac_mom_ncores_over_atm_ncores)))
 
     logger.debug(
-        f"ATM ncores range, stepsize = ({min_atm_ncores}, {max_atm_ncores}, {layout_search_config.atm_ncore_stepsize})"
+        "ATM ncores range, stepsize = (%s, %s, %s)",
+        min_atm_ncores,
+        max_atm_ncores,
+        layout_search_config.atm_ncore_stepsize,
     )
-    logger.debug(f"OCN ncores range = ({ncores_left - max_atm_ncores}, {ncores_left - min_atm_ncores})")
+    logger.debug("OCN ncores range = (%s, %s)", ncores_left - max_atm_ncores, ncores_left - min_atm_ncores)
     layout = _generate_esm1p6_layout_from_core_counts(
         min_atm_ncores=min_atm_ncores,
         max_atm_ncores=max_atm_ncores,
@@ -574,7 +628,7 @@ def generate_esm1p6_core_layouts_from_node_count(
     # Still works even if layout == [] (i.e., no layouts found)
     layout = sorted(layout, key=lambda x: (-x.ncores_used, abs(x.atm_nx - x.atm_ny) + abs(x.mom_nx - x.mom_ny)))
 
-    logger.info(f"Generated a total of {len(layout)} layouts for {num_nodes} nodes")
+    logger.info("Generated a total of %d layouts for %s nodes", len(layout), num_nodes)
 
     return layout
 
@@ -1,4 +1,5 @@
 import logging
+import math
 from typing import NamedTuple
 
 logger = logging.getLogger(__name__)
@@ -29,6 +30,17 @@ class LayoutTuple(NamedTuple):
         return self.atm_nx * self.atm_ny + self.mom_nx * self.mom_ny + self.ice_ncores
 
 
+# Control layouts of the supported models, keyed by model name. These are fixed, so they are built once at import time.
+_CTRL_LAYOUT_CONFIGS: dict[str, dict] = {
+    "ESM 1.6 PI config": {
+        "layout": LayoutTuple(atm_nx=16, atm_ny=13, mom_nx=14, mom_ny=14, ice_ncores=12),
+        "queue": "normalsr",
+        "totncores": 416,
+        "num_nodes": 4,
+    },
+}
+
+
 def get_ctrl_layout(model: str = "ESM 1.6 PI config") -> dict:
     """
     Get the control layout used in the current PI configuration.
@@ -61,16 +73,12 @@ def get_ctrl_layout(model: str = "ESM 1.6 PI config") -> dict:
     if not isinstance(model, str):
         raise TypeError(f"Model name must be a string. Got {type(model)} instead")
 
-    valid_models = ["ESM 1.6 PI config"]
-    if model not in valid_models:
-        raise ValueError(f"Model = {model} not allowed. Allowed values are {valid_models}")
+    ctrl_layout_config = _CTRL_LAYOUT_CONFIGS.get(model)
+    if ctrl_layout_config is None:
+        raise ValueError(f"Model = {model} not allowed. Allowed values are {list(_CTRL_LAYOUT_CONFIGS)}")
 
-    ctrl_layout_config = {}
-    ctrl_layout_config["layout"] = LayoutTuple(atm_nx=16, atm_ny=13, mom_nx=14, mom_ny=14, ice_ncores=12)
-    ctrl_layout_config["queue"] = "normalsr"
-    ctrl_layout_config["totncores"] = 416
-    ctrl_layout_config["num_nodes"] = 4
-    return ctrl_layout_config
+    # Return a copy, so that callers can modify it without changing the table
+    return dict(ctrl_layout_config)
 
 
 def find_layouts_with_maxncore(
@@ -112,8 +120,6 @@ def find_layouts_with_maxncore(
     ValueError
         If maxncore is not a positive integer or if abs_maxdiff_nx_ny is negative.
     """
-    import math
-
     if maxncore < 1:
         raise ValueError(f"Max. number of cores to use must be a positive integer. Got {maxncore} instead")
     if abs_maxdiff_nx_ny < 0:
@@ -4,8 +4,8 @@
 """Functions and classes for manipulating Lark parse trees.
 
 This module contains the low-level tree operations used by the configuration
-parser: updating node values, locating rule nodes, annotating parent references,
-and converting a parse tree into a dictionary of values and references.
+parser: updating node values, keeping lists in sync with the tree, copying
+trees, and converting a parse tree into a dictionary of values and references.
 
 Lark parse tree structure
 -------------------------
@@ -44,30 +44,49 @@ All grammars used with this module must follow these conventions:
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, SupportsIndex
 
-from lark import Token, Tree, Visitor
+from lark import Token, Tree
 from lark.reconstruct import Reconstructor
-from lark.visitors import Interpreter
 
-from access.config.parser_types import VALUE_TYPE_HANDLER_REGISTRY
+from access.config.parser_types import VALUE_TYPE_HANDLER_REGISTRY, ValueTypeHandler
 
+if TYPE_CHECKING:
+    from access.config.parser import Config
 
-def update_node_value(rule_node: Tree, value: Any) -> None:
-    """Updates the value stored in a value-type rule node.
+_config_class: type[Config] | None = None  # Resolved on first use by _get_config_class
 
-    The rule node must be a ``Tree`` whose ``.data`` is a key in ``VALUE_TYPE_HANDLER_REGISTRY``
-    (e.g. ``"integer"``, ``"float"``). The handler is looked up from that registry.
+
+def _get_config_class() -> type[Config]:
+    """Return the ``Config`` class, importing it on first use.
+
+    ``Config`` cannot be imported at module scope, as ``access.config.parser`` imports this module (Config ->
+    ConfigToDict -> Config). The class is cached in a module-level variable, so that callers only pay for the import
+    once.
+
+    Returns:
+        type[Config]: The ``Config`` class.
+    """
+    global _config_class
+    if _config_class is None:
+        from access.config.parser import Config
+
+        _config_class = Config
+    return _config_class
+
+
+def _update_node_value_with_handler(rule_node: Tree, handler: ValueTypeHandler | None, value: Any) -> None:
+    """Updates the value stored in a value-type rule node, using the given handler.
 
     Args:
         rule_node (Tree): Value-type rule node to update.
+        handler (ValueTypeHandler | None): Handler registered for the rule node, or None if there is none.
         value (Any): New value.
 
     Raises:
         TypeError: Raises an exception if the new and old value types do not match.
     """
-    data_name: str | None = getattr(rule_node, "data", None)
-    handler = VALUE_TYPE_HANDLER_REGISTRY.get(data_name)
     if handler is None or not handler.type_check(value):
         raise TypeError("Trying to change value type")
     # The Token storing the value is always the first child of a value-type rule node.
@@ -77,57 +96,125 @@ def update_node_value(rule_node: Tree, value: Any) -> None:
     rule_node.children[0] = token.update(value=transformed_value)
 
 
-def find_rule_node(ref: list[Tree] | Tree) -> Tree:
-    """Given a parse-tree reference for a key, return the corresponding key rule node.
+def update_node_value(rule_node: Tree, value: Any) -> None:
+    """Updates the value stored in a value-type rule node.
 
-    References are stored differently depending on the key rule type:
+    The rule node must be a ``Tree`` whose ``.data`` is a key in ``VALUE_TYPE_HANDLER_REGISTRY``
+    (e.g. ``"integer"``, ``"float"``). The handler is looked up from that registry.
+
+    Args:
+        rule_node (Tree): Value-type rule node to update.
+        value (Any): New value.
+
+    Raises:
+        TypeError: Raises an exception if the new and old value types do not match.
+    """
+    data_name: str | None = getattr(rule_node, "data", None)
+    _update_node_value_with_handler(rule_node, VALUE_TYPE_HANDLER_REGISTRY.get(data_name), value)
 
-    - ``key_list``: *ref* is a list of value-type rule nodes (one per list element);
-      the key rule node is the ``.parent`` of any element.
-    - ``key_null``: *ref* is the key rule node itself.
-    - ``key_value`` / ``key_block``: *ref* is a value-type rule node (child of the key
-      rule node); the key rule node is its ``.parent``.
+
+def update_node_values(rule_nodes: list[Tree], values: list[Any]) -> None:
+    """Updates the values stored in a list of value-type rule nodes.
+
+    Same as calling ``update_node_value`` for each pair of rule node and value, but the handler is only looked up when
+    the rule changes from one rule node to the next. List elements usually share the same type, so for most lists the
+    handler is looked up once.
 
     Args:
-        ref: A value-type rule node, a list of value-type rule nodes, or a key rule node,
-            as stored in ``_refs``.
+        rule_nodes (list[Tree]): Value-type rule nodes to update.
+        values (list[Any]): New values, one per rule node.
+
+    Raises:
+        TypeError: Raises an exception if the new and old value types do not match.
+    """
+    data_name = None
+    handler = None
+    for rule_node, value in zip(rule_nodes, values, strict=True):
+        # Rule nodes produced by the same grammar rule share the same ``.data`` object, so an identity check is enough
+        # to know if the handler can be reused.
+        if rule_node.data is not data_name:
+            data_name = rule_node.data
+            handler = VALUE_TYPE_HANDLER_REGISTRY.get(data_name)
+        _update_node_value_with_handler(rule_node, handler, value)
+
+
+def clone_tree(tree: Tree) -> Tree:
+    """Return a structural copy of a parse tree.
+
+    All ``Tree`` nodes (and their ``children`` lists) are copied, while ``Token`` leaves are shared with the original
+    tree. Tokens are immutable (``Token`` is a ``str`` subclass and value updates always create a new ``Token``), so
+    there is no need to copy them, which makes this much cheaper than a deep copy.
+
+    Args:
+        tree (Tree): Root rule node of the tree to copy.
 
     Returns:
-        Tree: The key rule node (``Tree`` whose ``.data`` starts with ``"key_"``).
+        Tree: The copy of the tree.
     """
-    if isinstance(ref, list):
-        return ref[0].parent  # type: ignore[attr-defined]
-    elif hasattr(ref, "data") and ref.data.startswith("key_"):
-        # Note that, although ``key_value`` and ``key_block`` contain ``key_`` in their names, the refs stored for these
-        # types are **children** of the key rule node, so their ``.data`` does not start with ``"key_"``.
-        return ref
-    else:
-        return ref.parent  # type: ignore[attr-defined]
-
-
-class AddParent(Visitor):
-    """Lark visitor that annotates every ``Tree`` node with a ``.parent`` back-reference.
-
-    ``Token`` children (terminal leaves) are skipped and only ``Tree`` children (rule nodes)
-    receive the ``.parent`` attribute. This enables upward traversal of the parse tree,
-    which Lark does not provide natively.
+    return Tree(tree.data, [clone_tree(child) if isinstance(child, Tree) else child for child in tree.children])
+
+
+class ConfigList(list):
+    """A list subclass that keeps the parse tree in sync when individual elements are modified.
+
+    When an element is updated via index assignment (e.g., ``config["key"][i] = new_value``), the corresponding
+    value-type rule node in the Lark parse tree is also updated so that round-trip reconstruction reflects the change.
+
+    Args:
+        data: The list data.
+        refs: List of references to the value-type rule nodes (one per list element).
     """
 
-    def __default__(self, tree: Tree) -> None:
-        for subtree in tree.children:
-            if isinstance(subtree, Tree):
-                assert not hasattr(subtree, "parent")
-                subtree.parent = tree  # type: ignore
+    __slots__ = ("_refs",)
+
+    _refs: list[Tree]  # Value-type rule nodes from the parse tree, one per list element.
 
+    def __init__(self, data: list[Any], refs: list[Tree]) -> None:
+        super().__init__(data)
+        self._refs = refs
 
-class ConfigToDict(Interpreter):
-    """Interpreter to be used by Lark to create a dict holding the config data and the corresponding dict of references
-    to rule nodes in the parse tree.
+    def __setitem__(self, index: SupportsIndex | slice, value: Any) -> None:
+        """Override to update both the list element(s) and the parse tree node(s).
+
+        Supports both integer indices and slices. When using slices, the number of
+        elements assigned must match the number of elements in the slice (i.e. the
+        list length cannot change).
+
+        Args:
+            index: Integer index or slice of the element(s) to update.
+            value: New value (or iterable of values for slices). The type of each value
+                must match the type already stored in the corresponding value-type rule node.
+
+        Raises:
+            ValueError: If a slice assignment would change the list length.
+        """
+        if isinstance(index, slice):
+            refs_slice = self._refs[index]
+            values = list(value)
+            if len(values) != len(refs_slice):
+                raise ValueError(f"Slice assignment would change list length from {len(refs_slice)} to {len(values)}")
+            update_node_values(refs_slice, values)
+            super().__setitem__(index, values)
+        else:
+            update_node_value(self._refs[index], value)
+            super().__setitem__(index, value)
+
+
+class ConfigToDict:
+    """Tree walker used to create a dict holding the config data and the corresponding dict of references to rule nodes
+    in the parse tree.
 
     A Lark ``Transformer`` would be the usual choice, but it replaces rule nodes with transformed values, destroying
-    the original tree.  Using an ``Interpreter`` instead lets us retain references to the original rule nodes so that
-    they can be mutated later to support round-trip editing.  The ``Interpreter`` also skips visiting child rule nodes
-    automatically, so each callback handles an entire key rule subtree in one call.
+    the original tree.  Walking the tree instead lets us retain references to the original rule nodes so that they can
+    be mutated later to support round-trip editing.  The tree is walked in pre-order, from left to right, and each key
+    rule node is dispatched to the callback named after its rule. The children of key rule nodes are not visited, so
+    each callback handles an entire key rule subtree in one call. This is the same behaviour as a Lark ``Interpreter``,
+    but using an explicit stack and a dict lookup per node instead of recursive generic dispatch.
+
+    Lark does not provide parent references, so while walking the tree we also record the parent of each key rule
+    node, which is needed to remove keys from the tree. Parents are stored in a dict keyed by the ``id()`` of the key
+    rule node, instead of being set as attributes on the nodes themselves. This is safe as long as the tree is alive,
+    as it holds references to all its nodes.
 
     While processing blocks, instances of this class need extra information to instantiate a ``Config``. We store that
     extra information as private class arguments.
@@ -138,31 +225,52 @@ class ConfigToDict(Interpreter):
     """
 
     _data: dict[str, Any]  # Config data accumulated while traversing the tree.
-    _refs: dict[str, list[Tree] | Tree]  # References to rule nodes in the parse tree, keyed by config key.
+    _refs: dict[str, tuple[Tree, list[Tree] | Tree]]  # References to rule nodes in the parse tree, keyed by config key.
+    # Each reference is a (key rule node, value reference) tuple, where the value reference is:
     # For key_list: a list of value-type rule nodes (one per element).
     # For key_value / key_block / key_null: a single rule node.
+    _parents: dict[int, Tree]  # Parents of the key rule nodes, keyed by the id() of the key rule node.
     _reconstructor: Reconstructor  # Lark reconstructor.
     _case_sensitive_keys: bool  # Are keys case-sensitive?
+    _callbacks: dict[str, Callable[[Tree], None]]  # Callbacks for the key rule nodes, keyed by rule name.
 
     def __init__(self, reconstructor: Reconstructor, case_sensitive_keys: bool) -> None:
         self._reconstructor = reconstructor
         self._case_sensitive_keys = case_sensitive_keys
-        super().__init__()
-
-    def visit(self, tree: Tree) -> tuple[dict[str, Any], dict[str, list[Tree] | Tree]]:
-        """Visit the entire tree and return two dictionaries: one holding the parsed values and the other holding,
-        for each config key, a reference to the corresponding rule node (or list of rule nodes) in the parse tree.
+        self._callbacks = {
+            "key_value": self.key_value,
+            "key_list": self.key_list,
+            "key_block": self.key_block,
+            "key_null": self.key_null,
+        }
+
+    def visit(self, tree: Tree) -> tuple[dict[str, Any], dict[str, tuple[Tree, list[Tree] | Tree]], dict[int, Tree]]:
+        """Visit the entire tree and return three dictionaries: one holding the parsed values, another one holding, for
+        each config key, the key rule node and a reference to the corresponding value rule node (or list of rule nodes)
+        in the parse tree, and a last one holding the parents of the key rule nodes.
 
         Args:
             tree (Tree): Root rule node to visit.
 
         Returns:
-            tuple[dict[str, Any], dict[str, list[Tree] | Tree]]: Dict of parsed values, dict of rule node references.
+            tuple[dict[str, Any], dict[str, tuple[Tree, list[Tree] | Tree]], dict[int, Tree]]: Dict of parsed values,
+                dict of rule node references, dict of key rule node parents.
         """
         self._data = {}
         self._refs = {}
-        super().visit(tree)
-        return self._data, self._refs
+        self._parents = {}
+        stack: list[tuple[Tree, Tree | None]] = [(tree, None)]
+        while stack:
+            node, parent = stack.pop()
+            callback = self._callbacks.get(node.data)
+            if callback is not None:
+                if parent is not None:
+                    self._parents[id(node)] = parent
+                callback(node)
+            else:
+                # Push the children in reverse order, so that they are visited from left to right
+                stack.extend((child, node) for child in reversed(node.children) if isinstance(child, Tree))
+        return self._data, self._refs, self._parents
 
     def _get_key(self, tree: Tree) -> str:
         """Given a key rule node, extract and return the key name.
@@ -180,16 +288,14 @@ class ConfigToDict(Interpreter):
             str: The key name (uppercased if keys are case-insensitive).
 
         """
-        key_rules = [child.children for child in tree.children if child.data == "key"]
-        if len(key_rules) == 0:
+        # Multiple "key" rule nodes are possible (e.g., if the tree is a key_block storing one of more key_values) but
+        # the correct one should always be the first one, so stop at the first match.
+        key_rule = next((child for child in tree.children if child.data == "key"), None)
+        if key_rule is None:
             raise ValueError("No 'key' rule nodes found among children of key rule node")
-        else:
-            # Multiple "key" rule nodes are possible (e.g., if the tree is a key_block storing one of more key_values)
-            # but the correct one should always be the first one.
-            key_rule = key_rules[0]
 
         # The token holding the key name is the first child of the "key" rule node.
-        key_token = key_rule[0]
+        key_token = key_rule.children[0]
         if isinstance(key_token, Token):
             key = key_token.value
         else:
@@ -217,10 +323,17 @@ class ConfigToDict(Interpreter):
             Tuple[List[Any], List[Tree]]: List of Python values, list of the corresponding
                 value-type rule nodes (for storing in ``_refs``).
         """
-        value_rule_nodes = [child for child in children if child.data in VALUE_TYPE_HANDLER_REGISTRY]
+        values = []
+        value_rule_nodes = []
+        get_handler = VALUE_TYPE_HANDLER_REGISTRY.get
+        for child in children:
+            handler = get_handler(child.data)
+            if handler is None:
+                continue
+            value_rule_nodes.append(child)
+            values.append(handler.from_token(str(child.children[0])))
         if len(value_rule_nodes) == 0:
             raise ValueError("No values found in Tree")
-        values = [VALUE_TYPE_HANDLER_REGISTRY[node.data].from_token(str(node.children[0])) for node in value_rule_nodes]
         return values, value_rule_nodes
 
     def _transform_value(self, children: list[Tree]) -> tuple[Any, Tree]:
@@ -241,47 +354,47 @@ class ConfigToDict(Interpreter):
         return values[0], value_rule_nodes[0]
 
     def key_list(self, tree: Tree) -> None:
-        """Interpreter callback for ``"key_list"`` rule nodes.
+        """Callback for ``"key_list"`` rule nodes.
 
         Args:
             tree (Tree): Rule node produced by the ``"key_list"`` grammar rule.
         """
         key = self._get_key(tree)
-        self._data[key], self._refs[key] = self._transform_values(tree.children)
+        values, value_rule_nodes = self._transform_values(tree.children)
+        # Wrap the values in a ConfigList so that element-level updates keep the parse tree in sync
+        self._data[key] = ConfigList(values, value_rule_nodes)
+        self._refs[key] = (tree, value_rule_nodes)
 
     def key_value(self, tree: Tree) -> None:
-        """Interpreter callback for ``"key_value"`` rule nodes.
+        """Callback for ``"key_value"`` rule nodes.
 
         Args:
             tree (Tree): Rule node produced by the ``"key_value"`` grammar rule.
         """
         key = self._get_key(tree)
-        self._data[key], self._refs[key] = self._transform_value(tree.children)
+        self._data[key], value_rule_node = self._transform_value(tree.children)
+        self._refs[key] = (tree, value_rule_node)
 
     def key_block(self, tree: Tree) -> None:
-        """Interpreter callback for ``"key_block"`` rule nodes.
+        """Callback for ``"key_block"`` rule nodes.
 
         Args:
             tree (Tree): Rule node produced by the ``"key_block"`` grammar rule.
         """
-        # Import here to avoid circular dependency (Config -> ConfigToDict -> Config)
-        from access.config.parser import Config as ConfigImpl
+        config_class = _config_class or _get_config_class()
 
         key = self._get_key(tree)
-        for child in tree.children:
-            if child.data == "block":
-                self._data[key] = ConfigImpl(child, self._reconstructor, self._case_sensitive_keys)
-                self._refs[key] = child
-                return
-            else:
-                pass
+        block = next((child for child in tree.children if child.data == "block"), None)
+        if block is not None:
+            self._data[key] = config_class(block, self._reconstructor, self._case_sensitive_keys)
+            self._refs[key] = (tree, block)
 
     def key_null(self, tree: Tree) -> None:
-        """Interpreter callback for ``"key_null"`` rule nodes.
+        """Callback for ``"key_null"`` rule nodes.
 
         Args:
             tree (Tree): Rule node produced by the ``"key_null"`` grammar rule.
         """
         key = self._get_key(tree)
         self._data[key] = None
-        self._refs[key] = tree
+        self._refs[key] = (tree, tree)
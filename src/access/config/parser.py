@@ -13,57 +13,20 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, SupportsIndex
+from typing import Any, ClassVar
 
 from lark import Lark, Tree
 from lark.reconstruct import Reconstructor
 
-from access.config.parse_tree_ops import AddParent, ConfigToDict, find_rule_node, update_node_value
+from access.config.parse_tree_ops import (
+    ConfigList,
+    ConfigToDict,
+    clone_tree,
+    update_node_value,
+    update_node_values,
+)
 
-
-class ConfigList(list):
-    """A list subclass that keeps the parse tree in sync when individual elements are modified.
-
-    When an element is updated via index assignment (e.g., ``config["key"][i] = new_value``), the corresponding
-    value-type rule node in the Lark parse tree is also updated so that round-trip reconstruction reflects the change.
-
-    Args:
-        data: The list data.
-        refs: List of references to the value-type rule nodes (one per list element).
-    """
-
-    _refs: list[Tree]  # Value-type rule nodes from the parse tree, one per list element.
-
-    def __init__(self, data: list[Any], refs: list[Tree]) -> None:
-        super().__init__(data)
-        self._refs = refs
-
-    def __setitem__(self, index: SupportsIndex | slice, value: Any) -> None:
-        """Override to update both the list element(s) and the parse tree node(s).
-
-        Supports both integer indices and slices. When using slices, the number of
-        elements assigned must match the number of elements in the slice (i.e. the
-        list length cannot change).
-
-        Args:
-            index: Integer index or slice of the element(s) to update.
-            value: New value (or iterable of values for slices). The type of each value
-                must match the type already stored in the corresponding value-type rule node.
-
-        Raises:
-            ValueError: If a slice assignment would change the list length.
-        """
-        if isinstance(index, slice):
-            refs_slice = self._refs[index]
-            values = list(value)
-            if len(values) != len(refs_slice):
-                raise ValueError(f"Slice assignment would change list length from {len(refs_slice)} to {len(values)}")
-            for ref, v in zip(refs_slice, values, strict=True):
-                update_node_value(ref, v)
-            super().__setitem__(index, values)
-        else:
-            update_node_value(self._refs[index], value)
-            super().__setitem__(index, value)
+_MISSING = object()  # Sentinel for dict lookups of keys that might not exist
 
 
 class Config(dict):
@@ -81,11 +44,14 @@ class Config(dict):
     """
 
     _tree: Tree  # The full parse tree
-    _refs: dict[str, list[Tree] | Tree]
-    # References to rule nodes in the parse tree, keyed by config key:
+    _refs: dict[str, tuple[Tree, list[Tree] | Tree]]
+    # References to rule nodes in the parse tree, keyed by config key. Each reference is a tuple holding the key rule
+    # node (Tree whose .data starts with "key_") and a value reference:
     #   scalar keys  → a single value-type rule node (Tree whose .data is in VALUE_TYPE_HANDLER_REGISTRY)
     #   list keys    → a list of value-type rule nodes (one per element)
     #   block keys   → the "block" rule node (Tree whose .data == "block")
+    #   null keys    → the key rule node itself
+    _parents: dict[int, Tree]  # Parents of the key rule nodes in the parse tree, keyed by id() of the key rule node
     _reconstructor: Reconstructor  # Lark reconstructor used for round-trip parsing
     _case_sensitive_keys: bool  # Are the dict keys case insensitive?
 
@@ -94,13 +60,7 @@ class Config(dict):
         self._reconstructor = reconstructor
         self._case_sensitive_keys = case_sensitive_keys
         interpreter = ConfigToDict(reconstructor, case_sensitive_keys)
-        data, self._refs = interpreter.visit(self._tree)
-        # Wrap list values in ConfigList so that element-level updates keep the parse tree in sync
-        for key in data:
-            if isinstance(data[key], list):
-                refs = self._refs[key]
-                assert isinstance(refs, list)
-                data[key] = ConfigList(data[key], refs)
+        data, self._refs, self._parents = interpreter.visit(self._tree)
         super().__init__(data)
 
     # --- Key normalisation (SRP) ---
@@ -132,14 +92,13 @@ class Config(dict):
             TypeError: If the existing value is not a list.
             ValueError: If the new list has a different length.
         """
-        refs = self._refs[key]
+        _, refs = self._refs[key]
         if not isinstance(refs, list):
             raise TypeError(f"Trying to change the type of variable '{key}'")
         if len(refs) != len(value):
             raise ValueError(f"Trying to change the length of list '{key}'")
 
-        for rule_node, v in zip(refs, value, strict=True):
-            update_node_value(rule_node, v)
+        update_node_values(refs, value)
 
         return ConfigList(value, refs)
 
@@ -149,8 +108,8 @@ class Config(dict):
         Returns:
             str: The reconstructed text (trailing newline stripped).
         """
-        # The reconstructor modifies the tree in-place, so work on a deep copy
-        tree = self._tree.__deepcopy__(None)
+        # The reconstructor modifies the structure of the tree in-place, so work on a copy
+        tree = clone_tree(self._tree)
         reconstructed = self._reconstructor.reconstruct(tree)
         return reconstructed[:-1] if reconstructed.endswith("\n") else reconstructed
 
@@ -172,10 +131,11 @@ class Config(dict):
         key = self._normalize_key(key)
 
         # Currently we only support replacing existing values, not adding new ones
-        if key not in self:
+        current = super().get(key, _MISSING)
+        if current is _MISSING:
             raise KeyError(f"Key doesn't exist: {key}")
 
-        if self[key] is None:
+        if current is None:
             if value is None:
                 return
             else:
@@ -188,7 +148,7 @@ class Config(dict):
             value = self._update_list_value(key, value)
 
         else:
-            ref = self._refs[key]
+            _, ref = self._refs[key]
             if not isinstance(ref, Tree):
                 raise TypeError(f"Trying to change the type of variable '{key}'")
             update_node_value(ref, value)
@@ -204,15 +164,15 @@ class Config(dict):
         super().__delitem__(key)
 
         # Remove the key rule node from the parse tree
-        key_rule_node = find_rule_node(self._refs[key])
-        key_rule_node.parent.children.remove(key_rule_node)  # type: ignore[attr-defined]
+        key_rule_node, _ = self._refs[key]
+        self._parents.pop(id(key_rule_node)).children.remove(key_rule_node)
 
         # Remove the rule node reference
         del self._refs[key]
 
     def __str__(self) -> str:
         """Override method to print dict contents to a string."""
-        if dict(self) == {}:
+        if not self:
             return ""
         return self._reconstruct()
 
@@ -227,11 +187,11 @@ class ConfigParser(ABC):
       - list/array (e.g., 'a=1,2,3')
       - block/dict containing other key-value assignments (e.g., 'blk: b=1, c=2')
 
-    Because the resulting parse trees are all processed using the ``ConfigToDict`` Interpreter, whose callbacks are
+    Because the resulting parse trees are all processed using the ``ConfigToDict`` tree walker, whose callbacks are
     named after grammar rules, all grammars must follow the same structure and use the same rule names:
 
       - Key-value assignment rules must be named (or aliased to): ``"key_value"``, ``"key_list"``, and
-        ``"key_block"``. The ``ConfigToDict`` Interpreter dispatches to methods of those exact names.
+        ``"key_block"``. The ``ConfigToDict`` tree walker dispatches to methods of those exact names.
       - Only value-type rules from ``"config.lark"`` should be used for scalar values. Their names must be registered
         in ``VALUE_TYPE_HANDLER_REGISTRY``.
       - The rule that captures the key name must be named ``"key"``. Its first child must be a ``Token`` (terminal)
@@ -240,8 +200,14 @@ class ConfigParser(ABC):
 
     This class is made abstract to prevent instantiation, as it requires a Lark grammar to be provided in order to work
     correctly.
+
+    Building a Lark parser from a grammar is expensive, so the parser and the corresponding reconstructor are built
+    only once per grammar and parsing algorithm, and then shared by all instances of the parser classes.
     """
 
+    # Lark parsers and reconstructors already built, keyed by grammar and parsing algorithm
+    _parser_cache: ClassVar[dict[tuple[str, str], tuple[Lark, Reconstructor]]] = {}
+
     @property
     @abstractmethod
     def grammar(self) -> str:
@@ -260,6 +226,36 @@ class ConfigParser(ABC):
             bool: Are the keys case-sensitive?
         """
 
+    @property
+    def parser_algorithm(self) -> str:
+        """Parsing algorithm used by Lark (``"earley"`` or ``"lalr"``).
+
+        Earley can handle any context-free grammar, including ambiguous ones, which is why it is the default. Parsers
+        whose grammar is LALR(1) compatible can override this property and return ``"lalr"``, which parses in linear
+        time.
+
+        Returns:
+            str: The parsing algorithm.
+        """
+        return "earley"
+
+    def _get_parser(self) -> tuple[Lark, Reconstructor]:
+        """Return the Lark parser and reconstructor for this parser's grammar, building them on first use.
+
+        Returns:
+            tuple[Lark, Reconstructor]: The Lark parser and the reconstructor built from it.
+        """
+        key = (self.grammar, self.parser_algorithm)
+        if key not in self._parser_cache:
+            parser = Lark(
+                self.grammar,
+                parser=self.parser_algorithm,
+                import_paths=[Path(__file__).parent],
+                maybe_placeholders=False,
+            )
+            self._parser_cache[key] = (parser, Reconstructor(parser))
+        return self._parser_cache[key]
+
     def parse(self, stream: str) -> Config:
         """Parse the given text.
 
@@ -269,12 +265,10 @@ class ConfigParser(ABC):
         Returns:
             Config: instance of the Config class storing the parsed data.
         """
-        parser = Lark(self.grammar, import_paths=[Path(__file__).parent], maybe_placeholders=False)
+        parser, reconstructor = self._get_parser()
 
         # Parse text. Here we add a newline character to simplify the writting of the grammars, as otherwise one would
         # have to explicitly take into account the case where the text does no end with a newline.
         tree = parser.parse(stream + "\n")
 
-        AddParent().visit(tree)
-        reconstructor = Reconstructor(parser)
         return Config(tree, reconstructor, self.case_sensitive_keys)
@@ -13,6 +13,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+_FORTRAN_EXP_TRANS = str.maketrans("Dd", "Ee")  # Maps Fortran double precision exponents to Python ones
+_EXP_CHARS = frozenset("DdEe")  # Characters that can mark the exponent of a float token
+
 
 def _float_to_str(value: float, token_text: str) -> str:
     """Convert a float to a string using the same exponent notation as the original token text.
@@ -28,13 +31,12 @@ def _float_to_str(value: float, token_text: str) -> str:
         str: The float as a string.
     """
     for c in token_text:
-        if c in ["D", "d", "E", "e"]:
+        if c in _EXP_CHARS:
             return str(value).replace("e", c)
-    else:
-        return str(value)
+    return str(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValueTypeHandler:
     """Encapsulates all operations for a single value type.
 
@@ -61,61 +63,121 @@ class ValueTypeHandler:
     to_token: Callable[[Any, str], str]
 
 
+# Type checks, parsers and serialisers used by the handlers below. Where a builtin already does the job (e.g. ``int``
+# or ``float`` to parse a token), the builtin is used directly instead of being wrapped in a function.
+
+
+def _is_bool(value: Any) -> bool:
+    """Return True if the value is a bool."""
+    return type(value) is bool
+
+
+def _is_int(value: Any) -> bool:
+    """Return True if the value is an int (bools excluded)."""
+    return type(value) is int
+
+
+def _is_float(value: Any) -> bool:
+    """Return True if the value is a float."""
+    return type(value) is float
+
+
+def _is_complex(value: Any) -> bool:
+    """Return True if the value is a complex number."""
+    return type(value) is complex
+
+
+def _is_identifier(value: Any) -> bool:
+    """Return True if the value is a string that is a valid identifier."""
+    return type(value) is str and value.isidentifier()
+
+
+def _is_str(value: Any) -> bool:
+    """Return True if the value is a string."""
+    return type(value) is str
+
+
+def _is_path(value: Any) -> bool:
+    """Return True if the value is a Path."""
+    return isinstance(value, Path)
+
+
+def _logical_from_token(token: str) -> bool:
+    """Convert a Fortran logical token (``.true.``/``.false.``, case-insensitive) to a bool."""
+    return str(token).lower() == ".true."
+
+
+def _logical_to_token(value: bool, token: str) -> str:
+    """Convert a bool to a Fortran logical token."""
+    return ".true." if value else ".false."
+
+
+def _bool_from_token(token: str) -> bool:
+    """Convert a ``True``/``False`` token to a bool."""
+    return str(token) == "True"
+
+
+def _bool_to_token(value: bool, token: str) -> str:
+    """Convert a bool to a ``True``/``False`` token."""
+    return "True" if value else "False"
+
+
+def _double_from_token(token: str) -> float:
+    """Convert a Fortran double precision token (e.g. ``1.0d10``) to a float."""
+    return float(token.translate(_FORTRAN_EXP_TRANS))
+
+
+def _complex_from_token(token: str) -> complex:
+    """Convert a complex token of the form ``(real, imag)`` to a complex number."""
+    # The grammar guarantees the token is enclosed in parentheses and has exactly one comma. Any whitespace around the
+    # two numbers is accepted by float().
+    real, imag = token[1:-1].split(",")
+    return complex(float(real), float(imag))
+
+
+def _double_complex_from_token(token: str) -> complex:
+    """Convert a Fortran double precision complex token (e.g. ``(1.0d0, 2.0d0)``) to a complex number."""
+    return _complex_from_token(token.translate(_FORTRAN_EXP_TRANS))
+
+
+def _complex_to_token(value: complex, token: str) -> str:
+    """Convert a complex number to a ``(real, imag)`` token, keeping the exponent notation of the original token."""
+    return "(" + _float_to_str(value.real, token) + ", " + _float_to_str(value.imag, token) + ")"
+
+
+def _string_from_token(token: str) -> str:
+    """Strip the quotes from a string token."""
+    return token[1:-1]
+
+
+def _string_to_token(value: str, token: str) -> str:
+    """Convert a string to a token, using the same quotes as the original token."""
+    return token[0] + value + token[-1]
+
+
+def _value_to_token(value: Any, token: str) -> str:
+    """Convert a value to a token using ``str``."""
+    return str(value)
+
+
+def _identifier_to_token(value: str, token: str) -> str:
+    """Return the identifier unchanged, as its token text is the identifier itself."""
+    return value
+
+
 VALUE_TYPE_HANDLER_REGISTRY: dict[str | None, ValueTypeHandler] = {
-    "logical": ValueTypeHandler(
-        type_check=lambda value: type(value) is bool,
-        from_token=lambda token: str(token).lower() == ".true.",
-        to_token=lambda value, token: ".true." if value else ".false.",
-    ),
-    "bool": ValueTypeHandler(
-        type_check=lambda value: type(value) is bool,
-        from_token=lambda token: str(token) == "True",
-        to_token=lambda value, token: "True" if value else "False",
-    ),
-    "integer": ValueTypeHandler(
-        type_check=lambda value: type(value) is int,
-        from_token=lambda token: int(token),
-        to_token=lambda value, token: str(value),
-    ),
-    "float": ValueTypeHandler(
-        type_check=lambda value: type(value) is float,
-        from_token=lambda token: float(token),
-        to_token=lambda value, token: _float_to_str(value, token),
-    ),
-    "double": ValueTypeHandler(
-        type_check=lambda value: type(value) is float,
-        from_token=lambda token: float(token.replace("D", "E").replace("d", "e")),
-        to_token=lambda value, token: _float_to_str(value, token),
-    ),
-    "complex": ValueTypeHandler(
-        type_check=lambda value: type(value) is complex,
-        from_token=lambda token: complex(*map(float, token.strip("()").split(","))),
-        to_token=lambda value, token: (
-            "(" + _float_to_str(value.real, token) + ", " + _float_to_str(value.imag, token) + ")"
-        ),
-    ),
+    "logical": ValueTypeHandler(type_check=_is_bool, from_token=_logical_from_token, to_token=_logical_to_token),
+    "bool": ValueTypeHandler(type_check=_is_bool, from_token=_bool_from_token, to_token=_bool_to_token),
+    "integer": ValueTypeHandler(type_check=_is_int, from_token=int, to_token=_value_to_token),
+    "float": ValueTypeHandler(type_check=_is_float, from_token=float, to_token=_float_to_str),
+    "double": ValueTypeHandler(type_check=_is_float, from_token=_double_from_token, to_token=_float_to_str),
+    "complex": ValueTypeHandler(type_check=_is_complex, from_token=_complex_from_token, to_token=_complex_to_token),
     "double_complex": ValueTypeHandler(
-        type_check=lambda value: type(value) is complex,
-        from_token=lambda token: complex(*map(float, token.replace("D", "E").replace("d", "e").strip("()").split(","))),
-        to_token=lambda value, token: (
-            "(" + _float_to_str(value.real, token) + ", " + _float_to_str(value.imag, token) + ")"
-        ),
-    ),
-    "identifier": ValueTypeHandler(
-        type_check=lambda value: type(value) is str and value.isidentifier(),
-        from_token=lambda token: str(token),
-        to_token=lambda value, token: value,
-    ),
-    "string": ValueTypeHandler(
-        type_check=lambda value: type(value) is str,
-        from_token=lambda token: token[1:-1],
-        to_token=lambda value, token: token[0] + value + token[-1],
-    ),
-    "path": ValueTypeHandler(
-        type_check=lambda value: isinstance(value, Path),
-        from_token=lambda token: Path(token),
-        to_token=lambda value, token: str(value),
+        type_check=_is_complex, from_token=_double_complex_from_token, to_token=_complex_to_token
     ),
+    "identifier": ValueTypeHandler(type_check=_is_identifier, from_token=str, to_token=_identifier_to_token),
+    "string": ValueTypeHandler(type_check=_is_str, from_token=_string_from_token, to_token=_string_to_token),
+    "path": ValueTypeHandler(type_check=_is_path, from_token=Path, to_token=_value_to_token),
 }
 """Registry mapping value-type rule names to their ``ValueTypeHandler``.
 
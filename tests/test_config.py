@@ -322,6 +322,19 @@ def test_config_list(parser):
         config["a"] = [1, 2]
 
 
+def test_config_mixed_type_list_update(parser):
+    """Test updating a list whose elements have different types"""
+    config = parser.parse("a = 1, 2.0, 'b', 3")
+
+    config["a"] = [10, 20.0, "c", 30]
+    assert config["a"] == [10, 20.0, "c", 30]
+    assert str(config) == "a=10,20.0,'c',30"
+
+    # Each element must keep its own type
+    with pytest.raises(TypeError):
+        config["a"] = [10, 20.0, 30, 40]
+
+
 def test_config_list_element_update_in_block(parser):
     """Test updating individual elements in a list inside a block"""
     config = parser.parse("block < a:2 b:4|5|6 >")
@@ -494,3 +507,52 @@ def test_config_wrong_key_rule(wrong_parser):
     """Test incorrect case where keys are not terminals"""
     with pytest.raises(TypeError):
         wrong_parser.parse("10=.true.")
+
+
+def test_config_parser_cache(parser, case_parser):
+    """Test that the Lark parser and reconstructor are only built once per grammar"""
+    config1 = parser.parse("a=1")
+    config2 = Parser().parse("b=2")
+    assert config1._reconstructor is config2._reconstructor
+
+    # Parsers with the same grammar share the Lark objects, regardless of the case-sensitivity of the keys
+    config3 = case_parser.parse("a=1")
+    assert config1._reconstructor is config3._reconstructor
+
+
+class LALRParser(ConfigParser):
+    """Parser with a LALR(1) compatible grammar, using the LALR parsing algorithm."""
+
+    @property
+    def case_sensitive_keys(self) -> bool:
+        return True
+
+    @property
+    def parser_algorithm(self) -> str:
+        return "lalr"
+
+    @property
+    def grammar(self) -> str:
+        return """
+    start: (key_value|key_list)*
+
+    key_value: key "=" value
+    key_list: key "=" value ("," value)+
+
+    ?value: integer
+
+    %import config.key
+    %import config.integer
+
+    %import common.WS
+    %ignore WS
+"""
+
+
+def test_config_lalr_parser():
+    """Test parsers using the LALR algorithm"""
+    config = LALRParser().parse("a = 1 b = 2, 3")
+    assert dict(config) == {"a": 1, "b": [2, 3]}
+
+    config["b"] = [4, 5]
+    assert str(config) == "a=1 b=4,5"
@@ -1,6 +1,8 @@
 # Copyright 2025 ACCESS-NRI and contributors. See the top-level COPYRIGHT file for details.
 # SPDX-License-Identifier: Apache-2.0
 
+import logging
+
 import pytest
 
 from access.config.esm1p6_layout_input import (
@@ -169,51 +171,80 @@ def test_layout_search_config(layout_search_config):
         assert getattr(config, attr_name) is False, f"Expected False, got {getattr(config, attr_name)}"
 
 
-def test_generate_esm1p6_layout_from_core_counts(layout_tuple, layout_search_config):
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param(
+            {"min_atm_ncores": 120, "max_atm_ncores": 96, "ice_ncores": 6, "ncores_for_atm_and_ocn": 208 - 6},
+            id="inverted_atm_range",
+        ),
+        pytest.param(
+            {"min_atm_ncores": 1, "max_atm_ncores": 96, "ice_ncores": 6, "ncores_for_atm_and_ocn": 208 - 6},
+            id="too_few_atm_ncores",
+        ),
+        pytest.param(
+            {"min_atm_ncores": 96, "max_atm_ncores": 120, "ice_ncores": 0, "ncores_for_atm_and_ocn": 208 - 6},
+            id="zero_ice_ncores",
+        ),
+        pytest.param(
+            {
+                "min_atm_ncores": 96,
+                "max_atm_ncores": 120,
+                "ice_ncores": 6,
+                "ncores_for_atm_and_ocn": 208 - 2 * 6,
+                "min_ncores_needed": 208,
+            },
+            id="min_ncores_needed_too_large",
+        ),
+        pytest.param(
+            {
+                "min_atm_ncores": 2,
+                "max_atm_ncores": 2,
+                "ice_ncores": 6,
+                "ncores_for_atm_and_ocn": 2,
+                "min_ncores_needed": 1,
+            },
+            id="too_few_atm_and_ocn_ncores",
+        ),
+        pytest.param(
+            {
+                "min_atm_ncores": 98,
+                "max_atm_ncores": 102,
+                "ice_ncores": 6,
+                "ncores_for_atm_and_ocn": 0,
+                "min_ncores_needed": 6,
+            },
+            id="zero_atm_and_ocn_ncores",
+        ),
+        pytest.param(
+            {
+                "min_atm_ncores": 2,
+                "max_atm_ncores": 10,
+                "ice_ncores": 1,
+                "ncores_for_atm_and_ocn": 5,
+                "min_ncores_needed": 4,
+            },
+            id="max_atm_ncores_leaves_no_mom_ncores",
+        ),
+        pytest.param(
+            {
+                "min_atm_ncores": 96,
+                "max_atm_ncores": 250,
+                "ice_ncores": 6,
+                "ncores_for_atm_and_ocn": 208 - 6,
+                "min_ncores_needed": 200,
+            },
+            id="max_atm_ncores_exceeds_atm_and_ocn_ncores",
+        ),
+    ],
+)
+def test_generate_esm1p6_layout_from_core_counts_invalid(kwargs):
     # Test the the validation works
     with pytest.raises(ValueError):
-        layouts = _generate_esm1p6_layout_from_core_counts(
-            min_atm_ncores=120,
-            max_atm_ncores=96,
-            ice_ncores=6,
-            ncores_for_atm_and_ocn=208 - 6,
-            min_ncores_needed=0,
-        )
-    with pytest.raises(ValueError):
-        layouts = _generate_esm1p6_layout_from_core_counts(
-            min_atm_ncores=1,
-            max_atm_ncores=96,
-            ice_ncores=6,
-            ncores_for_atm_and_ocn=208 - 6,
-            min_ncores_needed=0,
-        )
-    with pytest.raises(ValueError):
-        layouts = _generate_esm1p6_layout_from_core_counts(
-            min_atm_ncores=96,
-            max_atm_ncores=120,
-            ice_ncores=0,
-            ncores_for_atm_and_ocn=208 - 6,
-            min_ncores_needed=0,
-        )
+        _generate_esm1p6_layout_from_core_counts(**{"min_ncores_needed": 0, **kwargs})
 
-    with pytest.raises(ValueError):
-        layouts = _generate_esm1p6_layout_from_core_counts(
-            min_atm_ncores=96,
-            max_atm_ncores=120,
-            ice_ncores=6,
-            ncores_for_atm_and_ocn=208 - 2 * 6,
-            min_ncores_needed=208,
-        )
-
-    with pytest.raises(ValueError):
-        layouts = _generate_esm1p6_layout_from_core_counts(
-            min_atm_ncores=2,
-            max_atm_ncores=2,
-            ice_ncores=6,
-            ncores_for_atm_and_ocn=2,
-            min_ncores_needed=1,
-        )
 
+def test_generate_esm1p6_layout_from_core_counts(layout_tuple, layout_search_config):
     # Test with a valid core count
     core_count = 208
     max_atm_ncores = 120
@@ -251,7 +282,7 @@ def test_generate_esm1p6_layout_from_core_counts(layout_tuple, layout_search_con
         f"Expected more layouts when min_ncores_needed is less than "
         f"ncores_for_atm_and_ocn. Got {len(layouts_without_min_ncores)} vs {len(layouts)}"
     )
-    assert all(x in layouts_without_min_ncores for x in layouts), (
+    assert set(layouts).issubset(layouts_without_min_ncores), (
         "All layouts from the first call should be in the second call"
     )
 
@@ -274,17 +305,6 @@ def test_generate_esm1p6_layout_from_core_counts(layout_tuple, layout_search_con
     )
     assert layouts == [], f"Expected *no* layouts to be returned. Got layouts = {layouts}"
 
-    # Test with zero cores
-    core_count = 0
-    with pytest.raises(ValueError):
-        layouts = _generate_esm1p6_layout_from_core_counts(
-            max_atm_ncores=max_atm_ncores,
-            min_atm_ncores=min_atm_ncores,
-            ice_ncores=ice_ncores,
-            ncores_for_atm_and_ocn=0,
-            min_ncores_needed=ice_ncores,
-        )
-
     # Test that the layouts are returned with ncores_used <= ncores_for_atm_and_ocn
     assert all(x.ncores_used <= ncores_for_atm_and_ocn for x in layouts), (
         f"Some layouts have ncores_used > ncores_for_atm_and_ocn. "
@@ -297,20 +317,48 @@ def test_generate_esm1p6_layout_from_core_counts(layout_tuple, layout_search_con
     )
 
 
-def test_generate_esm1p6_core_layouts_from_node_count(esm1p6_ctrl_layout, layout_search_config):
+def test_generate_esm1p6_layout_from_core_counts_debug_logging(caplog, layout_search_config):
+    # Test that enabling debug logging reports the search without changing the layouts found
+    kwargs = {
+        "min_atm_ncores": 96,
+        "max_atm_ncores": 120,
+        "ice_ncores": 6,
+        "ncores_for_atm_and_ocn": 208 - 6,
+        "min_ncores_needed": 200,
+        "layout_search_config": layout_search_config(
+            frac_mom_ncores_over_atm_ncores=(0.75, 0.95), prefer_atm_ncores_greater_than_mom_ncores=True
+        ),
+    }
+    layouts = _generate_esm1p6_layout_from_core_counts(**kwargs)
+
+    with caplog.at_level(logging.DEBUG, logger="access.config.esm1p6_layout_input"):
+        debug_layouts = _generate_esm1p6_layout_from_core_counts(**kwargs)
+
+    assert debug_layouts == layouts
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(message.startswith("Trying atm_ncores") for message in messages)
+    assert any(message.startswith("Adding layout") for message in messages)
+    assert any(message.startswith("Skipping mom layout") for message in messages)
+    assert any(message.startswith("Skipping layout") for message in messages)
+    assert any(message.lstrip().startswith("Skipping atm layout") for message in messages)
+
+
+@pytest.mark.parametrize(
+    "num_nodes, cores_per_node, exception",
+    [
+        pytest.param("abcd", 104, TypeError, id="non_numeric_nodes"),
+        pytest.param(-3, 104, ValueError, id="negative_nodes"),
+        pytest.param(0, 104, ValueError, id="zero_nodes"),
+        pytest.param(1, -1, ValueError, id="negative_cores_per_node"),
+    ],
+)
+def test_generate_esm1p6_core_layouts_from_node_count_invalid(num_nodes, cores_per_node, exception):
     # Test that the validation works
-    with pytest.raises(TypeError):
-        layouts = generate_esm1p6_core_layouts_from_node_count("abcd", cores_per_node=104)
-
-    # Test with negative nodes
-    node_count = -3
-    with pytest.raises(ValueError):
-        generate_esm1p6_core_layouts_from_node_count(node_count, cores_per_node=104)
+    with pytest.raises(exception):
+        generate_esm1p6_core_layouts_from_node_count(num_nodes, cores_per_node=cores_per_node)
 
-    # Test with negative cores per node
-    with pytest.raises(ValueError):
-        generate_esm1p6_core_layouts_from_node_count(1, cores_per_node=-1)
 
+def test_generate_esm1p6_core_layouts_from_node_count(esm1p6_ctrl_layout, layout_search_config):
     # Test that with a very low node count, no layouts are returned (i.e. empty list of an empty list)
     layouts = generate_esm1p6_core_layouts_from_node_count(
         0.2, cores_per_node=104, layout_search_config=layout_search_config(max_wasted_ncores_frac=0.2)
@@ -341,11 +389,6 @@ def test_generate_esm1p6_core_layouts_from_node_count(esm1p6_ctrl_layout, layout
     layouts = layouts[0]
     assert esm1p6_ctrl_layout == layouts, f"Control config layout={esm1p6_ctrl_layout} not found in solved {layouts}"
 
-    # Test with zero nodes
-    node_count = 0
-    with pytest.raises(ValueError):
-        layouts = generate_esm1p6_core_layouts_from_node_count(node_count, cores_per_node=104)
-
     # Test with non-integer nodes
     node_count = 2.5
     layouts = generate_esm1p6_core_layouts_from_node_count(node_count, cores_per_node=104)
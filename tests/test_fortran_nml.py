@@ -13,7 +13,7 @@ def parser():
     return FortranNMLParser()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def fortran_nml():
     """Fixture returning a dict holding the parsed content of a Fortran namelist file."""
     return {
@@ -35,7 +35,7 @@ def fortran_nml():
     }
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def fortran_nml_file():
     """Fixture returning the content of a Fortran namelist file."""
     return """
@@ -68,7 +68,7 @@ def fortran_nml_file():
 """
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def modified_fortran_nml_file():
     """Fixture returning the content of the previous Fortran namelist file, but with some modifications."""
     return """
@@ -0,0 +1,47 @@
+# Copyright 2025 ACCESS-NRI and contributors. See the top-level COPYRIGHT file for details.
+# SPDX-License-Identifier: Apache-2.0
+
+import subprocess
+import sys
+
+import pytest
+
+import access.config
+from access.config.parser import ConfigParser
+
+
+def run_in_fresh_interpreter(code: str) -> None:
+    """Run code in a new Python process, as the modules under test have already been imported by this test session."""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_package_lazy_imports():
+    """Test that the parsers exported by the package are imported on first access"""
+    run_in_fresh_interpreter(
+        "import sys\n"
+        "import access.config.layout_config\n"
+        "assert 'lark' not in sys.modules\n"
+        "assert 'access.config.fortran_nml' not in sys.modules\n"
+        "from access.config import FortranNMLParser\n"
+        "assert 'lark' in sys.modules\n"
+        "assert FortranNMLParser is sys.modules['access.config.fortran_nml'].FortranNMLParser\n"
+    )
+
+    assert access.config.ConfigParser is ConfigParser
+    assert "FortranNMLParser" in dir(access.config)
+    with pytest.raises(AttributeError):
+        access.config.NotAParser  # noqa: B018
+
+
+def test_package_submodule_attributes():
+    """Test that the parser submodules are available as attributes of the package after importing it"""
+    run_in_fresh_interpreter(
+        "import sys\n"
+        "import access.config\n"
+        "for name in ('fortran_nml', 'mom6_input', 'nuopc_config', 'parse_tree_ops', 'parser', 'parser_types',\n"
+        "             'yaml_config'):\n"
+        "    assert getattr(access.config, name) is sys.modules[f'access.config.{name}']\n"
+    )
+
+    assert access.config.parser_types is sys.modules["access.config.parser_types"]
+    assert "yaml_config" in dir(access.config)
@@ -12,7 +12,7 @@ def parser():
     return YAMLParser()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def simple_yaml_config():
     """Fixture returning a dictionary storing a payu config file."""
     return {
@@ -32,7 +32,7 @@ def simple_yaml_config():
     }
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def simple_yaml_config_file():
     """Fixture returning the contents of a simple payu config file."""
     return """project: x77
@@ -50,7 +50,7 @@ input:
 """
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def yaml_config_file():
     """Fixture returning the contents of a more complex payu config file."""
     return """# PBS configuration
@@ -80,7 +80,7 @@ input:
 """
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def modified_yaml_config_file():
     """Fixture returning the contents the previous payu config file after introducing some modifications."""
     return """# PBS configuration